@@ -2,6 +2,15 @@
 
 from setuptools import find_packages, setup
 
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["src/matching/games/_stability_helpers.pyx"], language_level=3
+    )
+except ImportError:
+    ext_modules = []
+
 with open("README.rst", "r") as readme_file:
     README = readme_file.read()
 
@@ -21,6 +30,7 @@ setup(
     keywords=["game-theory gale-shapley matching-games"],
     packages=find_packages("src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     python_requires=">=3.5",
     tests_require=["pytest", "hypothesis", "numpy"],
 )
@@ -23,11 +23,28 @@ class BasePlayer:
     _pref_names : Optional[List]
         A list of the names in ``prefs``. Updates with ``prefs`` via
         ``set_prefs`` method.
+    _prefs_set : frozenset of BasePlayer
+        The current preferences as a frozenset for constant-time membership
+        tests. Updates whenever ``prefs`` does.
     _original_prefs : Optional[List[BasePlayer]]
         The original set of player preferences. Defaults to ``None`` and does
         not update after the first ``set_prefs`` method call.
+    _rank : Optional[Dict[BasePlayer, int]]
+        A map from each originally ranked player to their position in
+        ``_original_prefs``, so that ``prefers`` is a dictionary comparison
+        rather than a pair of list scans. Updates with ``_original_prefs``.
     """
 
+    __slots__ = (
+        "name",
+        "matching",
+        "_prefs",
+        "_prefs_set",
+        "_pref_names",
+        "_original_prefs",
+        "_rank",
+    )
+
     def __init__(self, name):
 
         self.name = name
@@ -36,11 +53,24 @@ class BasePlayer:
 
         self._pref_names = []
         self._original_prefs = None
+        self._rank = None
 
     def __repr__(self):
 
         return str(self.name)
 
+    @property
+    def prefs(self):
+        """ The player's current preference list. """
+
+        return self._prefs
+
+    @prefs.setter
+    def prefs(self, players):
+
+        self._prefs = players
+        self._prefs_set = frozenset(players) if players else frozenset()
+
     def _forget(self, other):
         """Forget another player by removing them from the player's preference
         list."""
@@ -68,11 +98,19 @@ class BasePlayer:
 
         if self._original_prefs is None:
             self._original_prefs = players[:]
+            self._rank = {player: rank for rank, player in enumerate(players)}
 
     def prefers(self, player, other):
         """Determines whether the player prefers a player over some other
         player."""
 
+        ranks = self._rank
+        if ranks is not None:
+            try:
+                return ranks[player] < ranks[other]
+            except KeyError:
+                pass
+
         prefs = self._original_prefs
         return prefs.index(player) < prefs.index(other)
 
@@ -132,10 +170,10 @@ class BaseGame(metaclass=abc.ABCMeta):
         """Remove a player from the game instance as well as any relevant
         player preference lists."""
 
-        party = vars(self)[player_party][:]
+        party = getattr(self, player_party)[:]
         party.remove(player)
-        vars(self)[player_party].remove(player)
-        for other in vars(self)[other_party]:
+        getattr(self, player_party).remove(player)
+        for other in getattr(self, other_party):
             if player in other.prefs:
                 other._forget(player)
 
@@ -144,7 +182,7 @@ class BaseGame(metaclass=abc.ABCMeta):
         player more than once. If so, and :code:`clean` is :code:`True`, then
         take the first instance they appear in the preference list."""
 
-        for player in vars(self)[party]:
+        for player in getattr(self, party):
             unique_prefs = []
             for other in player.prefs:
                 if other not in unique_prefs:
@@ -164,8 +202,8 @@ class BaseGame(metaclass=abc.ABCMeta):
         :code:`other_party`. If :code:`clean`, then forget any extra
         preferences."""
 
-        players = vars(self)[party]
-        others = vars(self)[other_party]
+        players = getattr(self, party)
+        others = getattr(self, other_party)
         for player in players:
 
             for other in player.prefs:
@@ -184,7 +222,7 @@ class BaseGame(metaclass=abc.ABCMeta):
         preference list of players in :code:`other_party`. If :code:`clean`,
         remove any such player."""
 
-        for player in vars(self)[party]:
+        for player in getattr(self, party):
 
             if not player.prefs:
                 warnings.warn(
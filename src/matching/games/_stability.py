@@ -0,0 +1,133 @@
+""" An optional, Numba-accelerated blocking pair scan for instances of HR.
+
+The players of a game are encoded as integer rank arrays so that the hot
+loop of ``HospitalResident.check_stability`` can be JIT-compiled, replacing
+interpreter dispatch and boxed comparisons with pure integer arithmetic. If
+Numba is not installed then ``NUMBA_AVAILABLE`` is ``False`` and the game
+falls back to the pure Python scan.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+
+_UNMATCHED = 2 ** 31 - 1
+
+
+def find_blocking_pairs(residents, hospitals):
+    """Find all of the blocking pairs in the current matching, scanning with
+    the compiled kernel. Pairs are returned in the same order as the pure
+    Python scan: by resident, then by their preference of hospital."""
+
+    arrays = _build_arrays(residents, hospitals)
+    flags = _stability_kernel(*arrays)
+
+    prefs = arrays[0]
+    return [
+        (residents[r], hospitals[prefs[r, spot]])
+        for r, spot in zip(*np.nonzero(flags))
+    ]
+
+
+def _build_arrays(residents, hospitals):
+    """Encode the players' preferences and current matches as integer arrays
+    for the stability kernel.
+
+    The encoding uses the players' positions in the lists given, and mirrors
+    the semantics of the pure Python helpers: mutual acceptability is judged
+    on the players' current preference lists, while the unhappiness
+    comparisons use ranks in their original ones, as ``prefers`` does."""
+
+    resident_idx = {res: i for i, res in enumerate(residents)}
+    hospital_idx = {hosp: j for j, hosp in enumerate(hospitals)}
+
+    num_residents, num_hospitals = len(residents), len(hospitals)
+    max_prefs = max((len(res.prefs) for res in residents), default=0)
+
+    prefs = np.full((num_residents, max_prefs), -1, dtype=np.int32)
+    rank_rh = np.full((num_residents, num_hospitals), -1, dtype=np.int32)
+    rank_hr = np.full((num_hospitals, num_residents), -1, dtype=np.int32)
+    acceptable = np.zeros((num_hospitals, num_residents), dtype=np.bool_)
+    match_rank = np.full(num_residents, _UNMATCHED, dtype=np.int32)
+    space = np.zeros(num_hospitals, dtype=np.bool_)
+    worst_rank = np.full(num_hospitals, -1, dtype=np.int32)
+
+    for i, resident in enumerate(residents):
+        for spot, hospital in enumerate(resident.prefs):
+            j = hospital_idx.get(hospital)
+            if j is not None:
+                prefs[i, spot] = j
+
+        original = resident._original_prefs or resident.prefs
+        for rank, hospital in enumerate(original):
+            j = hospital_idx.get(hospital)
+            if j is not None:
+                rank_rh[i, j] = rank
+
+        if resident.matching is not None:
+            match_rank[i] = original.index(resident.matching)
+
+    for j, hospital in enumerate(hospitals):
+        for resident in hospital.prefs:
+            i = resident_idx.get(resident)
+            if i is not None:
+                acceptable[j, i] = True
+
+        original = hospital._original_prefs or hospital.prefs
+        ranks = {player: rank for rank, player in enumerate(original)}
+        for player, rank in ranks.items():
+            i = resident_idx.get(player)
+            if i is not None:
+                rank_hr[j, i] = rank
+
+        if len(hospital.matching) < hospital.capacity:
+            space[j] = True
+        else:
+            worst = -1
+            for match in hospital.matching:
+                rank = ranks.get(match)
+                if rank is None:
+                    rank = original.index(match)
+                worst = max(worst, rank)
+            worst_rank[j] = worst
+
+    return prefs, acceptable, rank_rh, rank_hr, match_rank, space, worst_rank
+
+
+if NUMBA_AVAILABLE:
+
+    _KERNEL_SIGNATURE = (
+        "boolean[:, :](int32[:, :], boolean[:, :], int32[:, :], "
+        "int32[:, :], int32[:], boolean[:], int32[:])"
+    )
+
+    @njit(_KERNEL_SIGNATURE, parallel=True, nogil=True, cache=True)
+    def _stability_kernel(
+        prefs, acceptable, rank_rh, rank_hr, match_rank, space, worst_rank
+    ):
+        """Scan each resident's preference list for blocking pairs using
+        integer comparisons only. The residents are independent of one
+        another, so the outer loop runs across threads; each writes only to
+        its own row of the returned flag matrix, which marks the blocking
+        positions in each resident's preference list."""
+
+        num_residents, max_prefs = prefs.shape
+        flags = np.zeros((num_residents, max_prefs), dtype=np.bool_)
+
+        for r in prange(num_residents):
+            for spot in range(max_prefs):
+                h = prefs[r, spot]
+                if h == -1:
+                    continue
+                if not acceptable[h, r]:
+                    continue
+                if rank_rh[r, h] >= match_rank[r]:
+                    continue
+                if space[h] or rank_hr[h, r] < worst_rank[h]:
+                    flags[r, spot] = True
+
+        return flags
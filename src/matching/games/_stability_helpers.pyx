@@ -0,0 +1,40 @@
+""" Cython-compiled counterparts to the HR stability helpers.
+
+These mirror the pure Python helpers in
+``matching.games.hospital_resident`` exactly; compiling them removes the
+bytecode dispatch overhead from the blocking pair scan in environments
+without Numba. The Python versions remain the fallback whenever this
+extension has not been built.
+"""
+
+
+cpdef bint _check_resident_unhappy(object resident, object hospital):
+    """Determine whether a resident is unhappy because they are unmatched, or
+    they prefer the hospital to their current match."""
+
+    matching = resident.matching
+    return matching is None or resident.prefers(hospital, matching)
+
+
+cpdef bint _check_hospital_unhappy(object resident, object hospital):
+    """Determine whether a hospital is unhappy because they are
+    under-subscribed, or they prefer the resident to at least one of their
+    current matches."""
+
+    cdef int capacity = hospital.capacity
+    matching = hospital.matching
+    if len(matching) < capacity:
+        return True
+
+    ranks = hospital._match_ranks
+    rank_map = hospital._rank
+    rank = rank_map.get(resident) if rank_map else None
+    if ranks is None or rank is None:
+        for match in matching:
+            if hospital.prefers(resident, match):
+                return True
+        return False
+    if not ranks:
+        return False
+
+    return rank < ranks[-1]
@@ -1,6 +1,6 @@
 """ The HR game class and supporting functions. """
-import copy
 import warnings
+from copy import deepcopy
 
 from matching import BaseGame, MultipleMatching
 from matching import Player as Resident
@@ -12,6 +12,8 @@ from matching.exceptions import (
 )
 from matching.players import Hospital
 
+from . import _stability
+
 
 class HospitalResident(BaseGame):
     """A class for solving instances of the hospital-resident assignment
@@ -39,6 +41,15 @@ class HospitalResident(BaseGame):
         Cleaning is reductive in nature, removing players from the game and/or
         other player's preferences if they do not meet the requirements of the
         game.
+    copy : bool
+        Indicator for whether the players should be copied with
+        :func:`copy.deepcopy` rather than the faster, domain-aware clone used
+        by default. Defaults to :code:`False`. Either way, the players passed
+        in are left untouched by the game.
+    validated : bool
+        Indicator for whether the caller certifies that the players already
+        satisfy the conditions of the game, in which case
+        :code:`check_inputs` is skipped entirely. Defaults to :code:`False`.
 
     Attributes
     ----------
@@ -51,34 +62,95 @@ class HospitalResident(BaseGame):
         blocking pairs.
     """
 
-    def __init__(self, residents, hospitals, clean=False):
+    def __init__(
+        self, residents, hospitals, clean=False, copy=False, validated=False
+    ):
 
-        residents, hospitals = copy.deepcopy([residents, hospitals])
+        if copy:
+            residents, hospitals = deepcopy([residents, hospitals])
+        else:
+            residents, hospitals = _clone_players(residents, hospitals)
         self.residents = residents
         self.hospitals = hospitals
         self.clean = clean
 
         self._all_residents = residents
         self._all_hospitals = hospitals
+        self._ranked_by = None
 
         super().__init__(clean)
-        self.check_inputs()
+        if not validated:
+            self.check_inputs()
 
     @classmethod
     def create_from_dictionaries(
-        cls, resident_prefs, hospital_prefs, capacities, clean=False
+        cls,
+        resident_prefs,
+        hospital_prefs,
+        capacities,
+        clean=False,
+        validated=False,
     ):
         """Create an instance of :code:`HospitalResident` from two preference
         dictionaries and capacities. If :code:`clean=True` then remove players
         from the game and/or player preferences if they do not satisfy the
-        conditions of the game."""
+        conditions of the game. If :code:`validated=True` then the
+        dictionaries are taken to satisfy those conditions already and input
+        checking is skipped."""
 
         residents, hospitals = _make_players(
             resident_prefs, hospital_prefs, capacities
         )
-        game = cls(residents, hospitals, clean)
+        game = cls(residents, hospitals, clean, validated=validated)
         return game
 
+    @classmethod
+    def from_arrays(
+        cls,
+        resident_indptr,
+        resident_indices,
+        hospital_indptr,
+        hospital_indices,
+        capacities,
+        resident_names=None,
+        hospital_names=None,
+        clean=False,
+        validated=False,
+    ):
+        """Create an instance of :code:`HospitalResident` from preference
+        lists in CSR form, skipping the name-dictionary churn of
+        :code:`create_from_dictionaries`.
+
+        The preferences of the :math:`i`-th resident are the positional
+        hospital indices in
+        ``resident_indices[resident_indptr[i] : resident_indptr[i + 1]]``,
+        and symmetrically for the hospitals; :code:`capacities` holds one
+        capacity per hospital. Player names default to their positions
+        unless :code:`resident_names`/:code:`hospital_names` are given."""
+
+        num_residents = len(resident_indptr) - 1
+        num_hospitals = len(hospital_indptr) - 1
+        if resident_names is None:
+            resident_names = range(num_residents)
+        if hospital_names is None:
+            hospital_names = range(num_hospitals)
+
+        residents = [Resident(name) for name in resident_names]
+        hospitals = [
+            Hospital(name, int(capacity))
+            for name, capacity in zip(hospital_names, capacities)
+        ]
+
+        for i, resident in enumerate(residents):
+            lo, hi = resident_indptr[i], resident_indptr[i + 1]
+            resident.set_prefs([hospitals[j] for j in resident_indices[lo:hi]])
+
+        for j, hospital in enumerate(hospitals):
+            lo, hi = hospital_indptr[j], hospital_indptr[j + 1]
+            hospital.set_prefs([residents[i] for i in hospital_indices[lo:hi]])
+
+        return cls(residents, hospitals, clean, validated=validated)
+
     def solve(self, optimal="resident"):
         """Solve the instance of HR using either the resident- or
         hospital-oriented algorithm. Return the matching."""
@@ -112,7 +184,7 @@ class HospitalResident(BaseGame):
         player."""
 
         issues = []
-        for player in vars(self)[party]:
+        for player in getattr(self, party):
             issue = player.check_if_match_is_unacceptable(unmatched_okay=True)
             if isinstance(issue, list):
                 issues.extend(issue)
@@ -125,26 +197,40 @@ class HospitalResident(BaseGame):
         """ Check that no player in `party` is oversubscribed. """
 
         issues = []
-        for player in vars(self)[party]:
+        for player in getattr(self, party):
             issue = player.check_if_oversubscribed()
             if issue:
                 issues.append(issue)
 
         return issues
 
-    def check_stability(self):
+    def check_stability(self, find_all=True):
         """Check for the existence of any blocking pairs in the current
-        matching, thus determining the stability of the matching."""
+        matching, thus determining the stability of the matching.
+
+        By default, every blocking pair is collected and recorded in
+        :code:`blocking_pairs`, using the JIT-compiled scan if Numba is
+        installed. A caller that only needs the boolean can pass
+        :code:`find_all=False` to stop at the first blocking pair found."""
+
+        if find_all and _stability.NUMBA_AVAILABLE:
+            self.blocking_pairs = _stability.find_blocking_pairs(
+                self.residents, self.hospitals
+            )
+            return not any(self.blocking_pairs)
 
         blocking_pairs = []
         for resident in self.residents:
-            for hospital in self.hospitals:
+            for hospital in resident.prefs:
                 if (
-                    _check_mutual_preference(resident, hospital)
+                    resident in hospital._prefs_set
                     and _check_resident_unhappy(resident, hospital)
                     and _check_hospital_unhappy(resident, hospital)
                 ):
                     blocking_pairs.append((resident, hospital))
+                    if not find_all:
+                        self.blocking_pairs = blocking_pairs
+                        return False
 
         self.blocking_pairs = blocking_pairs
         return not any(blocking_pairs)
@@ -154,56 +240,142 @@ class HospitalResident(BaseGame):
         broken. If the :code:`clean` attribute is :code:`True`, then remove any
         such situations from the game."""
 
-        self._check_inputs_player_prefs_unique("residents")
-        self._check_inputs_player_prefs_unique("hospitals")
-
-        self._check_inputs_player_prefs_all_in_party("residents", "hospitals")
-        self._check_inputs_player_prefs_all_in_party("hospitals", "residents")
-
-        self._check_inputs_player_prefs_all_reciprocated("hospitals")
-        self._check_inputs_player_reciprocated_all_prefs(
+        self._check_inputs_player_prefs_unique_in_party(
+            "residents", "hospitals"
+        )
+        self._check_inputs_player_prefs_unique_in_party(
             "hospitals", "residents"
         )
 
-        self._check_inputs_player_prefs_nonempty("residents", "hospitals")
-        self._check_inputs_player_prefs_nonempty("hospitals", "residents")
+        self._ranked_by = _build_ranked_by(self.hospitals, self.residents)
+        self._check_inputs_player_reciprocity(
+            "hospitals", "residents", ranked_by=self._ranked_by
+        )
 
-        self._check_inputs_player_capacity("hospitals", "residents")
+        self._check_inputs_player_viability("residents", "hospitals")
+        self._check_inputs_player_viability(
+            "hospitals", "residents", check_capacity=True
+        )
 
-    def _check_inputs_player_prefs_all_reciprocated(self, party):
-        """Make sure that each player in :code:`party` has ranked only those
-        players that have ranked it."""
+    def _check_inputs_player_prefs_unique_in_party(self, party, other_party):
+        """Check that each player in :code:`party` has ranked only players in
+        :code:`other_party`, and none of them more than once, from a single
+        pass over their preferences. If :code:`clean`, restrict the player's
+        preferences to the unique, in-party ones."""
 
-        for player in vars(self)[party]:
+        others = frozenset(getattr(self, other_party))
+        for player in getattr(self, party):
 
+            seen = set()
+            cleaned_prefs = []
+            changed = False
             for other in player.prefs:
-                if player not in other.prefs:
+                if other in seen:
                     warnings.warn(
                         PreferencesChangedWarning(
-                            f"{player} ranked {other} but they did not."
+                            f"{player} has ranked {other} multiple times."
                         )
                     )
-                    if self.clean:
-                        player._forget(other)
+                    changed = True
+                    continue
+
+                seen.add(other)
+                if other not in others:
+                    warnings.warn(
+                        PreferencesChangedWarning(
+                            f"{player} has ranked a non-{other_party[:-1]}: "
+                            f"{other}."
+                        )
+                    )
+                    changed = True
+                    continue
+
+                cleaned_prefs.append(other)
+
+            if self.clean and changed:
+                player.set_prefs(cleaned_prefs)
+
+    def _check_inputs_player_viability(
+        self, party, other_party, check_capacity=False
+    ):
+        """Check that each player in :code:`party` has a nonempty preference
+        list and, if :code:`check_capacity`, a capacity of at least one. If
+        :code:`clean`, remove any player that does not from the game."""
+
+        for player in list(getattr(self, party)):
+
+            if not player.prefs:
+                warnings.warn(
+                    PlayerExcludedWarning(
+                        f"{player} has an empty preference list."
+                    )
+                )
+                if self.clean:
+                    self._remove_player(player, party, other_party)
+                continue
+
+            if check_capacity and player.capacity < 1:
+                warnings.warn(PlayerExcludedWarning(player))
+                if self.clean:
+                    self._remove_player(player, party, other_party)
+
+    def _check_inputs_player_prefs_all_reciprocated(self, party):
+        """Make sure that each player in :code:`party` has ranked only those
+        players that have ranked it."""
+
+        self._check_inputs_player_reciprocity(party, check_ranked=False)
 
     def _check_inputs_player_reciprocated_all_prefs(self, party, other_party):
         """Make sure that each player in :code:`party` has ranked all those
         players in :code:`other_party` that have ranked it."""
 
-        players = vars(self)[party]
-        others = vars(self)[other_party]
+        self._check_inputs_player_reciprocity(
+            party, other_party, check_prefs=False
+        )
+
+    def _check_inputs_player_reciprocity(
+        self,
+        party,
+        other_party=None,
+        check_prefs=True,
+        check_ranked=True,
+        ranked_by=None,
+    ):
+        """Make sure that the rankings between the players in :code:`party`
+        and those in :code:`other_party` are reciprocated, warning about both
+        directions from a single traversal of the players."""
+
+        players = getattr(self, party)
+
+        if check_ranked and ranked_by is None:
+            ranked_by = _build_ranked_by(players, getattr(self, other_party))
+        elif ranked_by is None:
+            ranked_by = {}
+
+        should_warn = not _warnings_suppressed(PreferencesChangedWarning)
         for player in players:
 
-            others_that_ranked = [
-                other for other in others if player in other.prefs
-            ]
-            for other in others_that_ranked:
-                if other not in player.prefs:
-                    warnings.warn(
-                        PreferencesChangedWarning(
-                            f"{other} ranked {player} but they did not."
+            if check_prefs:
+                for other in player.prefs:
+                    if player not in other._prefs_set:
+                        if should_warn:
+                            warnings.warn(
+                                PreferencesChangedWarning(
+                                    f"{player} ranked {other} "
+                                    "but they did not."
+                                )
+                            )
+                        if self.clean:
+                            player._forget(other)
+
+            for other in ranked_by.get(player, ()):
+                if other not in player._prefs_set:
+                    if should_warn:
+                        warnings.warn(
+                            PreferencesChangedWarning(
+                                f"{other} ranked {player} but they did not."
+                            )
                         )
-                    )
                     if self.clean:
                         other._forget(player)
 
@@ -212,7 +384,7 @@ class HospitalResident(BaseGame):
         one. If the :code:`clean` attribute is :code:`True`, remove any hospital
         that does not have such a capacity from the game."""
 
-        for player in vars(self)[party]:
+        for player in getattr(self, party):
             if player.capacity < 1:
                 warnings.warn(PlayerExcludedWarning(player))
 
@@ -220,19 +392,12 @@ class HospitalResident(BaseGame):
                     self._remove_player(player, party, other_party)
 
 
-def _check_mutual_preference(resident, hospital):
-    """ Determine whether two players each have a preference of the other. """
-
-    return resident in hospital.prefs and hospital in resident.prefs
-
-
 def _check_resident_unhappy(resident, hospital):
     """Determine whether a resident is unhappy because they are unmatched, or
     they prefer the hospital to their current match."""
 
-    return resident.matching is None or resident.prefers(
-        hospital, resident.matching
-    )
+    matching = resident.matching
+    return matching is None or resident.prefers(hospital, matching)
 
 
 def _check_hospital_unhappy(resident, hospital):
@@ -240,9 +405,87 @@ def _check_hospital_unhappy(resident, hospital):
     under-subscribed, or they prefer the resident to at least one of their
     current matches."""
 
-    return len(hospital.matching) < hospital.capacity or any(
-        [hospital.prefers(resident, match) for match in hospital.matching]
+    matching = hospital.matching
+    if len(matching) < hospital.capacity:
+        return True
+
+    ranks = hospital._match_ranks
+    rank = hospital._rank.get(resident) if hospital._rank else None
+    if ranks is None or rank is None:
+        return any(hospital.prefers(resident, match) for match in matching)
+    if not ranks:
+        return False
+
+    return rank < ranks[-1]
+
+
+try:
+    from ._stability_helpers import (  # noqa: F811
+        _check_hospital_unhappy,
+        _check_resident_unhappy,
     )
+except ImportError:
+    pass
+
+
+def _warnings_suppressed(category):
+    """Determine whether warnings of :code:`category` would be ignored
+    outright, by finding the first blanket entry of the warnings filter that
+    covers the category. A narrower covering filter with any other action
+    means some warnings may get through, so nothing is suppressed."""
+
+    for action, message, filter_category, module, lineno in warnings.filters:
+        if not issubclass(category, filter_category):
+            continue
+
+        if message is None and module is None and lineno == 0:
+            return action == "ignore"
+        if action != "ignore":
+            return False
+
+    return False
+
+
+def _build_ranked_by(players, others):
+    """Build a reverse index mapping each player in :code:`players` to the
+    players in :code:`others` that have ranked them. Each ranker appears at
+    most once per player, however many times they have ranked them."""
+
+    ranked_by = {player: [] for player in players}
+    for other in others:
+        for pref in other.prefs:
+            rankers = ranked_by.get(pref)
+            if rankers is not None and (
+                not rankers or rankers[-1] is not other
+            ):
+                rankers.append(other)
+
+    return ranked_by
+
+
+def _clone_players(residents, hospitals):
+    """Clone a set of residents and hospitals without the generic machinery of
+    :func:`copy.deepcopy`. New instances are built in one pass, and their
+    preferences rewired to the new instances in a second. The clone maps are
+    keyed by object identity so that players sharing a name are preserved as
+    distinct players."""
+
+    resident_clones = {id(res): Resident(res.name) for res in residents}
+    hospital_clones = {
+        id(hosp): Hospital(hosp.name, hosp.capacity) for hosp in hospitals
+    }
+
+    for resident in residents:
+        clone = resident_clones[id(resident)]
+        prefs = [hospital_clones.get(id(h), h) for h in resident.prefs]
+        clone.set_prefs(prefs)
+
+    for hospital in hospitals:
+        clone = hospital_clones[id(hospital)]
+        prefs = [resident_clones.get(id(r), r) for r in hospital.prefs]
+        clone.set_prefs(prefs)
+
+    return list(resident_clones.values()), list(hospital_clones.values())
 
 
 def _make_players(resident_prefs, hospital_prefs, capacities):
@@ -1,5 +1,7 @@
 """ The Hospital class for use in instances of HR. """
 
+from bisect import insort
+
 from matching import BasePlayer
 
 
@@ -30,8 +32,14 @@ class Hospital(BasePlayer):
     matching : list of Player
         The current matches of the hospital. An empty list if currently
         unsubscribed.
+    _match_ranks : list of int or None
+        The sorted, original-preference ranks of the current matches, kept in
+        step with ``matching`` so that "is anyone worse than this player?"
+        collapses to one comparison. ``None`` if any rank is indeterminate.
     """
 
+    __slots__ = ("capacity", "_original_capacity", "_matching", "_match_ranks")
+
     def __init__(self, name, capacity):
 
         super().__init__(name)
@@ -39,11 +47,37 @@ class Hospital(BasePlayer):
         self._original_capacity = capacity
         self.matching = []
 
+    @property
+    def matching(self):
+        """ The hospital's current matches. """
+
+        return self._matching
+
+    @matching.setter
+    def matching(self, matching):
+
+        self._matching = matching
+        self._match_ranks = self._build_match_ranks(matching)
+
+    def _build_match_ranks(self, matching):
+        """Compute the sorted original-preference ranks of ``matching``,
+        returning ``None`` if any rank cannot be determined."""
+
+        ranks = []
+        try:
+            for match in matching:
+                insort(ranks, self._rank[match])
+        except (KeyError, TypeError):
+            return None
+
+        return ranks
+
     def _match(self, resident):
         """ Add ``resident`` to the hospital's matching, and then sort it. """
 
         self.matching.append(resident)
         self.matching.sort(key=self.prefs.index)
+        self._match_ranks = self._build_match_ranks(self.matching)
 
     def _unmatch(self, resident):
         """ Remove ``resident`` from the hospital's matching. """
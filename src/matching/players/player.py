@@ -25,6 +25,8 @@ class Player(BasePlayer):
         The original set of player preferences.
     """
 
+    __slots__ = ()
+
     def _match(self, other):
         """ Assign the player to be matched to some other player. """
 
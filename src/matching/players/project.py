@@ -48,6 +48,7 @@ class Project(Hospital):
 
         self.matching.append(student)
         self.matching.sort(key=self.prefs.index)
+        self._match_ranks = self._build_match_ranks(self.matching)
         self.supervisor._match(student)
 
     def _unmatch(self, student):
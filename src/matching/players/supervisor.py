@@ -51,6 +51,7 @@ class Supervisor(Hospital):
         self.prefs = students
         self._pref_names = [student.name for student in students]
         self._original_prefs = students[:]
+        self._rank = {student: rank for rank, student in enumerate(students)}
 
         for project in self.projects:
             acceptable = [
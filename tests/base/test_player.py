@@ -1,4 +1,5 @@
 """ Tests for the BasePlayer class. """
+import pytest
 from hypothesis import given
 from hypothesis.strategies import text
 
@@ -111,3 +112,15 @@ def test_prefers(player_others):
     player.set_prefs(others)
     for i, other in enumerate(others[:-1]):
         assert player.prefers(other, others[i + 1])
+
+
+@given(player_others=player_others())
+def test_prefers_unranked_player(player_others):
+    """Test that comparing a preference of a player who does not appear in
+    the original preference list falls through to a list index lookup."""
+
+    player, others = player_others
+
+    player.set_prefs(others)
+    with pytest.raises(ValueError):
+        player.prefers(BasePlayer("unranked"), others[0])
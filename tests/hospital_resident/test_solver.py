@@ -13,6 +13,10 @@ from matching.exceptions import (
     PreferencesChangedWarning,
 )
 from matching.games import HospitalResident
+from matching.games.hospital_resident import (
+    _check_hospital_unhappy,
+    _warnings_suppressed,
+)
 from matching.players import Hospital
 
 from .util import connections, games, players
@@ -41,6 +45,46 @@ def test_init(players, clean):
     assert game.matching is None
 
 
+@given(players=players())
+def test_init_validated(players):
+    """Test that input checking is skipped entirely when the players are
+    certified as valid."""
+
+    residents, hospitals = players
+    residents[0].prefs = []
+
+    with warnings.catch_warnings(record=True) as w:
+        game = HospitalResident(residents, hospitals, validated=True)
+
+        assert not w
+        assert game.residents[0].prefs == []
+        assert len(game.residents) == len(residents)
+
+
+@given(players=players(), copy=booleans())
+def test_init_copy(players, copy):
+    """Test that the players passed to an instance are isolated from the
+    game by both the default clone and the deepcopy path."""
+
+    residents, hospitals = players
+    resident_prefs = [resident.prefs[:] for resident in residents]
+    hospital_prefs = [hospital.prefs[:] for hospital in hospitals]
+
+    game = HospitalResident(residents, hospitals, copy=copy)
+    game.solve()
+
+    for resident, prefs in zip(residents, resident_prefs):
+        assert resident.matching is None
+        assert resident.prefs == prefs
+
+    for hospital, prefs in zip(hospitals, hospital_prefs):
+        assert hospital.matching == []
+        assert hospital.prefs == prefs
+
+    assert all(resident not in residents for resident in game.residents)
+    assert all(hospital not in hospitals for hospital in game.hospitals)
+
+
 @given(connections=connections(), clean=booleans())
 def test_create_from_dictionaries(connections, clean):
     """Test that HospitalResident is created correctly when passed a set of
@@ -65,6 +109,34 @@ def test_create_from_dictionaries(connections, clean):
     assert game.clean is clean
 
 
+def test_from_arrays():
+    """Test that HospitalResident is created correctly when passed the
+    preferences of each party in CSR form."""
+
+    resident_indptr, resident_indices = [0, 1, 3], [0, 0, 1]
+    hospital_indptr, hospital_indices = [0, 2, 3], [0, 1, 1]
+    capacities = [1, 2]
+
+    game = HospitalResident.from_arrays(
+        resident_indptr,
+        resident_indices,
+        hospital_indptr,
+        hospital_indices,
+        capacities,
+    )
+
+    assert [resident.name for resident in game.residents] == [0, 1]
+    assert [hospital.name for hospital in game.hospitals] == [0, 1]
+
+    assert game.residents[0]._pref_names == [0]
+    assert game.residents[1]._pref_names == [0, 1]
+    assert game.hospitals[0]._pref_names == [0, 1]
+    assert game.hospitals[1]._pref_names == [1]
+    assert [hospital.capacity for hospital in game.hospitals] == capacities
+
+    assert game.matching is None
+
+
 @given(game=games())
 def test_check_inputs(game):
     """ Test that inputs to an instance of HR can be verified. """
@@ -115,6 +187,117 @@ def test_check_inputs_hospital_prefs_all_residents(game):
             assert hospital.prefs == []
 
 
+@given(game=games())
+def test_check_inputs_resident_prefs_unique_in_party(game):
+    """Test that every resident has ranked only hospitals, and none of them
+    more than once. If not, check that a warning is caught for each offence
+    and, when cleaning, the player's preferences are restricted to the
+    unique, in-party ones."""
+
+    resident = game.residents[0]
+    prefs = resident.prefs[:]
+    resident.prefs = prefs + [prefs[0], Resident("foo")]
+    with warnings.catch_warnings(record=True) as w:
+        game._check_inputs_player_prefs_unique_in_party(
+            "residents", "hospitals"
+        )
+
+        duplicate, non_party = w[-2].message, w[-1].message
+        assert isinstance(duplicate, PreferencesChangedWarning)
+        assert resident.name in str(duplicate)
+        assert prefs[0].name in str(duplicate)
+        assert isinstance(non_party, PreferencesChangedWarning)
+        assert resident.name in str(non_party)
+        assert "foo" in str(non_party)
+        if game.clean:
+            assert resident.prefs == prefs
+
+
+@given(game=games())
+def test_check_inputs_hospital_prefs_unique_in_party(game):
+    """Test that every hospital has ranked only residents, and none of them
+    more than once. If not, check that a warning is caught for each offence
+    and, when cleaning, the player's preferences are restricted to the
+    unique, in-party ones."""
+
+    hospital = game.hospitals[0]
+    prefs = hospital.prefs[:]
+    hospital.prefs = prefs + [prefs[0], Hospital("foo", 1)]
+    with warnings.catch_warnings(record=True) as w:
+        game._check_inputs_player_prefs_unique_in_party(
+            "hospitals", "residents"
+        )
+
+        duplicate, non_party = w[-2].message, w[-1].message
+        assert isinstance(duplicate, PreferencesChangedWarning)
+        assert hospital.name in str(duplicate)
+        assert prefs[0].name in str(duplicate)
+        assert isinstance(non_party, PreferencesChangedWarning)
+        assert hospital.name in str(non_party)
+        assert "foo" in str(non_party)
+        if game.clean:
+            assert hospital.prefs == prefs
+
+
+@given(game=games())
+def test_check_inputs_resident_viability(game):
+    """Test that every resident has a non-empty preference list. If not,
+    check that a warning is caught and, when cleaning, the player is removed
+    from the game."""
+
+    resident = game.residents[0]
+    resident.prefs = []
+    with warnings.catch_warnings(record=True) as w:
+        game._check_inputs_player_viability("residents", "hospitals")
+
+        message = w[-1].message
+        assert isinstance(message, PlayerExcludedWarning)
+        assert resident.name in str(message)
+        if game.clean:
+            assert resident not in game.residents
+
+
+@given(game=games())
+def test_check_inputs_hospital_viability(game):
+    """Test that every hospital has a capacity of at least one. If not,
+    check that a warning is caught and, when cleaning, the player is removed
+    from the game."""
+
+    hospital = game.hospitals[0]
+    hospital.capacity = 0
+    with warnings.catch_warnings(record=True) as w:
+        game._check_inputs_player_viability(
+            "hospitals", "residents", check_capacity=True
+        )
+
+        message = w[-1].message
+        assert isinstance(message, PlayerExcludedWarning)
+        assert hospital.name in str(message)
+        if game.clean:
+            assert hospital not in game.hospitals
+
+
+def test_warnings_suppressed():
+    """Test that warnings of a category only count as suppressed under a
+    blanket ignore filter with no narrower, non-ignore filter ahead of it."""
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert _warnings_suppressed(PreferencesChangedWarning)
+
+        warnings.filterwarnings("ignore", message="foo")
+        assert _warnings_suppressed(PreferencesChangedWarning)
+
+        warnings.filterwarnings("error", message="foo")
+        assert not _warnings_suppressed(PreferencesChangedWarning)
+
+    with warnings.catch_warnings(record=True) as w:
+        assert not _warnings_suppressed(PreferencesChangedWarning)
+
+        warnings.warn(PreferencesChangedWarning("foo"))
+        assert len(w) == 1
+
+
 @given(game=games())
 def test_check_inputs_hospital_prefs_all_reciprocated(game):
     """Test that each hospital has ranked only those residents that have ranked
@@ -340,3 +523,148 @@ def test_check_stability():
     matching[y] = [a, b]
 
     assert not game.check_stability()
+
+
+def test_check_stability_find_all():
+    """Test that HospitalResident can stop at the first blocking pair when
+    the caller only needs to know whether the matching is stable."""
+
+    residents = [Resident("A"), Resident("B"), Resident("C")]
+    hospitals = [Hospital("X", 2), Hospital("Y", 2)]
+
+    (a, b, c), (x, y) = residents, hospitals
+
+    a.set_prefs([x, y])
+    b.set_prefs([y])
+    c.set_prefs([y, x])
+
+    x.set_prefs([c, a])
+    y.set_prefs([a, b, c])
+
+    game = HospitalResident(residents, hospitals)
+
+    matching = game.solve()
+    assert game.check_stability(find_all=False)
+
+    (a, b, c), (x, y) = game.residents, game.hospitals
+    matching[x] = [c]
+    matching[y] = [a, b]
+
+    assert not game.check_stability(find_all=False)
+    (first_pair,) = game.blocking_pairs
+
+    assert not game.check_stability()
+    assert game.blocking_pairs[0] == first_pair
+
+
+def test_check_stability_numba_equivalence():
+    """Test that the compiled stability scan finds exactly the blocking
+    pairs of the pure Python scan."""
+
+    pytest.importorskip("numba")
+    from matching.games import _stability
+
+    residents = [Resident("A"), Resident("B"), Resident("C")]
+    hospitals = [Hospital("X", 2), Hospital("Y", 2)]
+
+    (a, b, c), (x, y) = residents, hospitals
+
+    a.set_prefs([x, y])
+    b.set_prefs([y])
+    c.set_prefs([y, x])
+
+    x.set_prefs([c, a])
+    y.set_prefs([a, b, c])
+
+    game = HospitalResident(residents, hospitals)
+    matching = game.solve()
+
+    (a, b, c), (x, y) = game.residents, game.hospitals
+    for assignment in ({x: [c, a], y: [b]}, {x: [c], y: [a, b]}):
+        for hospital, matches in assignment.items():
+            matching[hospital] = matches
+
+        compiled = game.check_stability()
+        compiled_pairs = game.blocking_pairs
+
+        _stability.NUMBA_AVAILABLE = False
+        try:
+            pure = game.check_stability()
+        finally:
+            _stability.NUMBA_AVAILABLE = True
+
+        assert compiled == pure
+        assert compiled_pairs == game.blocking_pairs
+
+
+def test_check_hospital_unhappy_indeterminate_ranks():
+    """Test that a full hospital falls back to scanning its matches when
+    their ranks are indeterminate, and that one without any matches can
+    never be unhappy."""
+
+    residents = [Resident("A"), Resident("B")]
+    hospital = Hospital("X", 2)
+    a, b = residents
+
+    a.set_prefs([hospital])
+    b.set_prefs([hospital])
+    hospital.set_prefs([a, b])
+
+    hospital.matching = [b, Resident("foo")]
+    assert hospital._match_ranks is None
+    assert _check_hospital_unhappy(a, hospital)
+
+    empty = Hospital("Y", 0)
+    empty.set_prefs([a])
+    assert not _check_hospital_unhappy(a, empty)
+
+
+def test_check_stability_unranked_match():
+    """Test that both stability scans raise when a full hospital is matched
+    to a player absent from its original preferences, as ``prefers`` does."""
+
+    pytest.importorskip("numba")
+    from matching.games import _stability
+
+    residents, hospitals = [Resident("A")], [Hospital("X", 1)]
+    (a,), (x,) = residents, hospitals
+
+    a.set_prefs([x])
+    x.set_prefs([a])
+
+    game = HospitalResident(residents, hospitals)
+    (x,) = game.hospitals
+    x.matching = [Resident("foo")]
+
+    with pytest.raises(ValueError):
+        game.check_stability()
+
+    _stability.NUMBA_AVAILABLE = False
+    try:
+        with pytest.raises(ValueError):
+            game.check_stability()
+    finally:
+        _stability.NUMBA_AVAILABLE = True
+
+
+def test_check_stability_unreciprocated_ranking():
+    """Test that the compiled stability scan does not count a pair as
+    blocking when the resident's ranking of the hospital is not returned."""
+
+    pytest.importorskip("numba")
+
+    residents = [Resident("A"), Resident("B")]
+    hospitals = [Hospital("X", 1)]
+    (a, b), (x,) = residents, hospitals
+
+    a.set_prefs([x])
+    b.set_prefs([x])
+    x.set_prefs([a])
+
+    game = HospitalResident(residents, hospitals, validated=True)
+    (a, b), (x,) = game.residents, game.hospitals
+    a.matching = x
+    x.matching = [a]
+
+    assert game.check_stability()
+    assert game.blocking_pairs == []